@@ -12,28 +12,32 @@ Features:
 """
 
 import sys
+import os
+import ctypes
+import ctypes.util
+import errno
+import select
 import numpy as np
 import socket
 import struct
 import threading
-import queue
 import time
 import argparse
-from collections import deque
 import imgui
 import imgui.integrations.glfw
 import glfw
 from OpenGL.GL import *
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_agg import FigureCanvasAgg
-from PIL import Image
-from joblib import Parallel, delayed
 
 try:
     import cupy as cp
+    import cupyx
     import numpy as np
     GPU_AVAILABLE = True
     GPU_BACKEND = "cupy"
+    # Fused uint16 -> float32 convert and per-axis scale over interleaved (x, y) pairs: one launch per batch
+    CANVAS_TRANSFORM_KERNEL = cp.ElementwiseKernel(
+        'uint16 screen, float32 scale_x, float32 scale_y', 'float32 canvas',
+        'canvas = screen * ((i & 1) ? scale_y : scale_x)', 'screen_to_canvas')
     print("GPU support available with CuPy")
 except ImportError:
     try:
@@ -51,82 +55,445 @@ except ImportError:
         print("GPU support not available (neither CuPy nor PyTorch with CUDA found)")
 
 try:
-    import threading
-    from concurrent.futures import ThreadPoolExecutor
-    PARALLEL_AVAILABLE = True
+    from numba import njit, prange, types as nb_types
+    NUMBA_AVAILABLE = True
 except ImportError:
-    PARALLEL_AVAILABLE = False
+    NUMBA_AVAILABLE = False
 
 
 # Constants matching C++ implementation
 DOT_SIZE = 2.0
 DOT_FADE_DURATION = 0.1  # 100ms fade duration
+INV_DOT_FADE_DURATION = 1.0 / DOT_FADE_DURATION  # Multiply instead of dividing per dot
+GPU_MIN_BATCH = 50000  # Smaller batches transform faster in NumPy than the PCIe round trip takes
+
+
+def color_u32(r, g, b, a):
+    """Pack float RGBA into ImGui's ImU32 exactly like imgui.get_color_u32_rgba, without needing a context"""
+    to_byte = lambda v: int(min(max(v, 0.0), 1.0) * 255.0 + 0.5)
+    return (to_byte(a) << 24) | (to_byte(b) << 16) | (to_byte(g) << 8) | to_byte(r)
+
+
+# Draw-list colors, packed once instead of per draw call
+BACKGROUND_COLOR = color_u32(0.08, 0.08, 0.08, 1.0)
+BORDER_COLOR = color_u32(0.4, 0.4, 0.4, 1.0)
+PLOT_LINE_COLOR = color_u32(0, 1, 0, 1.0)
+PLOT_MARKER_COLOR = color_u32(1, 1, 0, 1.0)
+
+# Dot colors indexed by int(255 * alpha) - matching C++ IM_COL32(0, 255 * alpha, 0, 255) and the red equivalent.
+# Little-endian ImU32 bytes are R, G, B, A, so these also feed the GL color buffer directly
+POSITIVE_DOT_COLORS = np.array([color_u32(0, i / 255.0, 0, 1.0) for i in range(256)], dtype=np.uint32)
+NEGATIVE_DOT_COLORS = np.array([color_u32(i / 255.0, 0, 0, 1.0) for i in range(256)], dtype=np.uint32)
+
+# UDP packet layout: uint64 packet timestamp followed by packed DVSEvents.
+# DVSEvent inherits the C++ Event struct, so each event occupies sizeof(Event) = 16 bytes:
+# timestamp(8) + x(2) + y(2) + polarity(1) + 3 bytes tail padding
+PACKET_HEADER = struct.Struct('<Q')
+PACKET_HEADER_SIZE = PACKET_HEADER.size
+EVENT_DTYPE = np.dtype({
+    'names': ['timestamp', 'x', 'y', 'polarity'],
+    'formats': ['<u8', '<u2', '<u2', 'i1'],
+    'offsets': [0, 8, 10, 12],
+    'itemsize': 16
+})
+
+# Other layouts seen from older streamer builds, detected per receiver from the first packet
+PACKED_EVENT_DTYPE = np.dtype({  # #pragma pack(1) Event: 13 bytes, no padding
+    'names': ['timestamp', 'x', 'y', 'polarity'],
+    'formats': ['<u8', '<u2', '<u2', 'i1'],
+    'offsets': [0, 8, 10, 12],
+    'itemsize': 13
+})
+LEGACY_EVENT_DTYPE = np.dtype({  # 32-byte DVSEvent with uint32 coordinates
+    'names': ['timestamp', 'x', 'y', 'polarity'],
+    'formats': ['<u8', '<u4', '<u4', 'u1'],
+    'offsets': [0, 8, 12, 16],
+    'itemsize': 32
+})
+CANDIDATE_EVENT_DTYPES = (EVENT_DTYPE, PACKED_EVENT_DTYPE, LEGACY_EVENT_DTYPE)  # Preference order for ties
+
+# Default inclusive coordinate bounds checked on every decoded packet (--width/--height override them)
+MAX_EVENT_X = 1920
+MAX_EVENT_Y = 1080
+
+MAX_DATAGRAM_SIZE = 65536  # Largest possible UDP payload - the size of every userspace receive buffer
+MAX_EVENTS_PER_PACKET = (MAX_DATAGRAM_SIZE - PACKET_HEADER_SIZE) // PACKED_EVENT_DTYPE.itemsize
+
+# Linux socket options not exported by the socket module
+SO_RCVBUFFORCE = getattr(socket, 'SO_RCVBUFFORCE', 33)
+SO_BUSY_POLL = getattr(socket, 'SO_BUSY_POLL', 46)
+SO_RXQ_OVFL = getattr(socket, 'SO_RXQ_OVFL', 40)
+
+# SO_RXQ_OVFL ancillary data: cmsghdr followed by the socket's cumulative uint32 kernel drop count
+RXQ_OVFL_CMSG = struct.Struct('@NiiI')
+RXQ_OVFL_CONTROL_SIZE = socket.CMSG_SPACE(4) if hasattr(socket, 'CMSG_SPACE') else 24
+
+
+if NUMBA_AVAILABLE:
+    # Eager signatures compile both kernels at import; cache=True keeps the machine code across runs.
+    # Packet fields arrive read-only (views over bytes from recvfrom) or writable (recvmmsg bytearray),
+    # and strided ('A') or, for packets of 0 or 1 events, contiguous ('C'). Each combination gets its own
+    # exact signature: a C view would otherwise coerce equally well to both 'A' overloads and be ambiguous.
+    def _packet_write_signature(readonly, layout):
+        field = lambda dtype: nb_types.Array(dtype, 1, layout, readonly=readonly)
+        ring = lambda dtype: nb_types.Array(dtype, 1, 'C')
+        return nb_types.int64(field(nb_types.uint64), field(nb_types.uint16), field(nb_types.uint16),
+                              field(nb_types.int8), ring(nb_types.uint64), ring(nb_types.uint16),
+                              ring(nb_types.uint16), ring(nb_types.int8), ring(nb_types.float64),
+                              nb_types.float64, nb_types.int64, nb_types.int64, nb_types.int64)
+    
+    @njit([_packet_write_signature(readonly, layout) for readonly in (True, False) for layout in ('A', 'C')],
+          cache=True, nogil=True)
+    def _write_valid_events(timestamps, xs, ys, polarities, ring_timestamps, ring_x, ring_y, ring_polarity,
+                            ring_received_time, received_time, start, max_x, max_y):
+        """Bounds-check packet events and append the valid ones to the ring in one pass"""
+        mask = ring_x.shape[0] - 1  # Ring capacity is a power of two
+        written = 0
+        for i in range(xs.shape[0]):
+            x = xs[i]
+            y = ys[i]
+            if x <= max_x and y <= max_y:
+                slot = (start + written) & mask
+                ring_timestamps[slot] = timestamps[i]
+                ring_x[slot] = x
+                ring_y[slot] = y
+                ring_polarity[slot] = polarities[i]
+                ring_received_time[slot] = received_time
+                written += 1
+        return written
+    
+    @njit("void(float64[:], float64, float64, float32[:])", cache=True, nogil=True, fastmath=True, parallel=True)
+    def _fade_events(received_times, now, fade_duration, out_alpha):
+        """Write the fade alpha of every event of the (pre-trimmed) fade window across all cores"""
+        inv_fade = 1.0 / fade_duration
+        for i in prange(received_times.shape[0]):
+            alpha = 1.0 - (now - received_times[i]) * inv_fade
+            out_alpha[i] = min(1.0, max(0.0, alpha))
 
 
 class EventData:
-    """Thread-safe container for neuromorphic event data"""
-    def __init__(self):
-        self.events = deque(maxlen=100000)  # Large buffer for event history
-        self.lock = threading.Lock()
-        self.stats = {'packets': 0, 'events': 0, 'bytes': 0}
-    
-    def add_event(self, timestamp, x, y, polarity):
-        with self.lock:
-            current_time = time.time()
-            self.events.append({
-                'timestamp': timestamp,
-                'x': x,
-                'y': y,
-                'polarity': polarity,
-                'received_time': current_time
-            })
-    
-    def get_recent_events(self, time_window=5.0):
-        """Get events from the last time_window seconds"""
-        with self.lock:
-            current_time = time.time()
-            cutoff_time = current_time - time_window
-            recent_events = [e for e in self.events if e['received_time'] >= cutoff_time]
-            return recent_events
+    """Lock-free single-producer/single-consumer ring of neuromorphic events.
+    
+    Events are stored as preallocated numpy columns. The UDP thread is the only
+    writer: it fills the slots first and then publishes them with a single store
+    to write_idx (a monotonic count of events ever written). Under CPython that
+    store is atomic and ordered after the slot writes, so the render thread can
+    snapshot write_idx and read every slot below it without taking a lock.
+    """
+    def __init__(self, capacity=100000):
+        # Large buffer for event history, rounded up to a power of two so slots wrap with a mask
+        capacity = 1 << max(0, capacity - 1).bit_length()
+        self.capacity = capacity
+        self.mask = capacity - 1
+        
+        # All columns are views into one contiguous allocation, widest dtype first to keep alignment
+        columns = (('timestamps', np.uint64), ('received_time', np.float64),
+                   ('x', np.uint16), ('y', np.uint16), ('polarity', np.int8))
+        self.buffer = bytearray(sum(np.dtype(dtype).itemsize for _, dtype in columns) * capacity)
+        offset = 0
+        for name, dtype in columns:
+            setattr(self, name, np.frombuffer(self.buffer, dtype=dtype, count=capacity, offset=offset))
+            offset += np.dtype(dtype).itemsize * capacity
+        self.write_idx = 0  # Published by the producer only
+        self.read_idx = 0  # Oldest event the consumer still cares about (moved by clear())
+        self.consumed_idx = 0  # write_idx seen by the consumer's last snapshot
+        self.dropped_events = 0  # Overwritten before the consumer ever saw them (consumer-owned)
+        self.stats = {'packets': 0, 'events': 0, 'bytes': 0, 'kernel_drops': 0}  # Written by the producer only
+    
+    def add_events_batch(self, timestamps, x, y, polarity, received_time):
+        """Copy a batch of event columns into the ring and publish them with one index store"""
+        n = min(len(x), self.capacity)
+        w = self.write_idx
+        start = w & self.mask
+        first = min(n, self.capacity - start)  # Slots before the wrap-around point
+        rest = n - first
+        for column, values in ((self.timestamps, timestamps), (self.x, x),
+                               (self.y, y), (self.polarity, polarity)):
+            values = values[len(values) - n:]
+            column[start:start + first] = values[:first]
+            if rest:
+                column[:rest] = values[first:]
+        self.received_time[start:start + first] = received_time
+        if rest:
+            self.received_time[:rest] = received_time
+        self.stats['events'] += len(x)
+        self.write_idx = w + n
+    
+    def add_packet_events(self, events, received_time, max_x=MAX_EVENT_X, max_y=MAX_EVENT_Y):
+        """Append the in-bounds events of a decoded EVENT_DTYPE packet array"""
+        if len(events) == 0:
+            return
+        if NUMBA_AVAILABLE:
+            w = self.write_idx
+            written = _write_valid_events(events['timestamp'], events['x'], events['y'], events['polarity'],
+                                          self.timestamps, self.x, self.y, self.polarity, self.received_time,
+                                          received_time, w & self.mask, max_x, max_y)
+            self.stats['events'] += written
+            self.write_idx = w + written
+        else:
+            valid = (events['x'] <= max_x) & (events['y'] <= max_y)
+            if not valid.all():
+                events = events[valid]  # Only pay for the compacting copy when something is out of range
+            if len(events) > 0:
+                self.add_events_batch(events['timestamp'], events['x'], events['y'],
+                                      events['polarity'], received_time)
+    
+    def _snapshot(self, column, begin, end):
+        """Copy ring slots [begin, end) (absolute event indices) oldest to newest"""
+        start = begin & self.mask
+        stop = start + (end - begin)
+        if stop <= self.capacity:
+            return column[start:stop].copy()
+        return np.concatenate((column[start:], column[:stop - self.capacity]))
+    
+    def _first_index_since(self, cutoff_time, begin, end):
+        """Absolute index of the first event in [begin, end) received at or after cutoff_time.
+        
+        received_time is non-decreasing in write order, so each of the (at most two)
+        contiguous ring segments is sorted and can be binary searched.
+        """
+        start = begin & self.mask
+        first = min(end - begin, self.capacity - start)
+        i = int(np.searchsorted(self.received_time[start:start + first], cutoff_time))
+        if i < first:
+            return begin + i
+        return begin + first + int(np.searchsorted(self.received_time[:end - begin - first], cutoff_time))
+    
+    def count_events_since(self, cutoff_time):
+        """Number of events received at or after cutoff_time, in O(log N)"""
+        end = self.write_idx
+        begin = max(self.read_idx, end - self.capacity)
+        return end - self._first_index_since(cutoff_time, begin, end)
+    
+    def _consume(self):
+        """Snapshot write_idx and return (oldest index still readable, end), accounting lapped events"""
+        end = self.write_idx
+        oldest = end - self.capacity
+        if oldest > self.consumed_idx:
+            # Overwrite-oldest backpressure: the producer lapped us, make the loss visible
+            self.dropped_events += oldest - self.consumed_idx
+        self.consumed_idx = end
+        return max(self.read_idx, oldest), end
+    
+    def get_recent_events_view(self, time_window=5.0, now=None):
+        """Get events from the last time_window seconds as a dict of numpy columns, oldest first.
+        
+        Pass now (a time.monotonic() reading) to share one clock sample with the caller.
+        """
+        begin, end = self._consume()
+        if now is None:
+            now = time.monotonic()
+        begin = self._first_index_since(now - time_window, begin, end)
+        return self._copy_events(begin, end)
+    
+    def get_new_events(self):
+        """Get the events published since the previous get_new_events/get_recent_events_view call"""
+        previous = self.consumed_idx
+        begin, end = self._consume()
+        begin = max(begin, previous)
+        view = self._copy_events(begin, end)
+        self.dropped_events += (end - begin) - len(view['x'])  # Torn slots are never offered again
+        return view
+    
+    def _copy_events(self, begin, end):
+        """Copy events [begin, end) into a dict of numpy columns, dropping slots torn by the producer"""
+        view = {
+            'timestamp': self._snapshot(self.timestamps, begin, end),
+            'x': self._snapshot(self.x, begin, end),
+            'y': self._snapshot(self.y, begin, end),
+            'polarity': self._snapshot(self.polarity, begin, end),
+            'received_time': self._snapshot(self.received_time, begin, end)
+        }
+        
+        # Staleness check: slots the producer published, or may be filling, while we copied are torn
+        stale = (self.write_idx + MAX_EVENTS_PER_PACKET - self.capacity) - begin
+        if stale > 0:
+            view = {name: column[stale:] for name, column in view.items()}
+        return view
     
     def clear(self):
-        with self.lock:
-            self.events.clear()
+        # Consumer-side: hide everything published so far without touching producer state
+        self.read_idx = self.write_idx
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p), ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(_IOVec)), ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p), ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr), ('msg_len', ctypes.c_uint)]
+
+
+class RecvmmsgReader:
+    """Drain up to batch_size datagrams per syscall with Linux recvmmsg(2).
+    
+    All datagrams land in one preallocated bytearray; receive() returns
+    memoryview slices into it, which stay valid until the next receive() call.
+    A readable wakeup socket ends the wait early with an empty batch.
+    """
+    def __init__(self, sock, libc, batch_size=64, wakeup=None):
+        self.socket = sock
+        self.batch_size = batch_size
+        self.wakeup = wakeup
+        self._recvmmsg = libc.recvmmsg
+        self._recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint,
+                                   ctypes.c_int, ctypes.c_void_p]
+        self._recvmmsg.restype = ctypes.c_int
+        
+        self.buffer = bytearray(batch_size * MAX_DATAGRAM_SIZE)
+        self.view = memoryview(self.buffer)
+        base = ctypes.addressof(ctypes.c_char.from_buffer(self.buffer))
+        self.iovecs = (_IOVec * batch_size)()
+        self.msgs = (_MMsgHdr * batch_size)()
+        for i in range(batch_size):
+            self.iovecs[i].iov_base = base + i * MAX_DATAGRAM_SIZE
+            self.iovecs[i].iov_len = MAX_DATAGRAM_SIZE
+            self.msgs[i].msg_hdr.msg_iov = ctypes.pointer(self.iovecs[i])
+            self.msgs[i].msg_hdr.msg_iovlen = 1
+        
+        # Per-slot control buffers receive the SO_RXQ_OVFL drop counter when the kernel has dropped datagrams
+        self.control = bytearray(batch_size * RXQ_OVFL_CONTROL_SIZE)
+        control_base = ctypes.addressof(ctypes.c_char.from_buffer(self.control))
+        for i in range(batch_size):
+            self.msgs[i].msg_hdr.msg_control = control_base + i * RXQ_OVFL_CONTROL_SIZE
+            self.msgs[i].msg_hdr.msg_controllen = RXQ_OVFL_CONTROL_SIZE
+        self.kernel_drops = 0  # Datagrams the kernel discarded because the receive queue was full
+        
+        # One persistent registration instead of rebuilding fd sets with select() on every wait
+        self._poller = select.poll()
+        self._poller.register(sock, select.POLLIN)
+        if wakeup is not None:
+            self._poller.register(wakeup, select.POLLIN)
+        self._backlogged = True
+    
+    @classmethod
+    def create(cls, sock, batch_size=64, wakeup=None):
+        """Return a reader for sock, or None when recvmmsg is unavailable on this platform"""
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            libc.recvmmsg
+        except (OSError, AttributeError):
+            return None
+        return cls(sock, libc, batch_size, wakeup)
+    
+    def receive(self):
+        """Return the datagrams currently queued, waiting up to the socket timeout for the first one"""
+        if not self._backlogged:
+            # Last batch drained the queue, so go straight to a wait instead of a speculative recvmmsg
+            timeout = self.socket.gettimeout()
+            ready = self._poller.poll(None if timeout is None else timeout * 1000)
+            if not ready:
+                raise socket.timeout()
+            if self.wakeup is not None and len(ready) == 1 and ready[0][0] == self.wakeup.fileno():
+                return []  # Woken without data; the caller rechecks whether it should keep running
+        count = self._recv_nowait()
+        self._backlogged = count == self.batch_size
+        self._read_drop_counts(count)
+        size = MAX_DATAGRAM_SIZE
+        return [self.view[i * size:i * size + self.msgs[i].msg_len] for i in range(count)]
+    
+    def _read_drop_counts(self, count):
+        """Pick up the newest SO_RXQ_OVFL counter and re-arm the control buffers the kernel just used"""
+        for i in range(count):
+            hdr = self.msgs[i].msg_hdr
+            if hdr.msg_controllen >= RXQ_OVFL_CMSG.size:
+                length, level, kind, drops = RXQ_OVFL_CMSG.unpack_from(self.control, i * RXQ_OVFL_CONTROL_SIZE)
+                if level == socket.SOL_SOCKET and kind == SO_RXQ_OVFL:
+                    self.kernel_drops = max(self.kernel_drops, drops)
+            hdr.msg_controllen = RXQ_OVFL_CONTROL_SIZE
+    
+    def _recv_nowait(self):
+        count = self._recvmmsg(self.socket.fileno(), self.msgs, self.batch_size, socket.MSG_DONTWAIT, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return 0
+            raise OSError(err, os.strerror(err))
+        return count
+
+
+class RecvIntoReader:
+    """Portable fallback for RecvmmsgReader: drain up to batch_size queued datagrams per wake-up.
+    
+    The socket is switched to non-blocking mode and waited on with select(), then emptied with
+    recv_into calls into one preallocated bytearray. receive() returns memoryview slices that stay
+    valid until the next receive() call. A readable wakeup socket ends the wait early with an empty batch.
+    """
+    def __init__(self, sock, batch_size=64, wakeup=None):
+        self.socket = sock
+        self.batch_size = batch_size
+        self.wait_timeout = sock.gettimeout()  # The caller's timeout now bounds the select() wait
+        self.waitables = [sock] if wakeup is None else [sock, wakeup]
+        sock.setblocking(False)
+        self.buffer = bytearray(batch_size * MAX_DATAGRAM_SIZE)
+        self.view = memoryview(self.buffer)
+        self.slots = [self.view[i * MAX_DATAGRAM_SIZE:(i + 1) * MAX_DATAGRAM_SIZE] for i in range(batch_size)]
+        self._backlogged = True
+    
+    def receive(self):
+        """Return the datagrams currently queued, waiting up to wait_timeout for the first one"""
+        if not self._backlogged:
+            readable = select.select(self.waitables, [], [], self.wait_timeout)[0]
+            if not readable:
+                raise socket.timeout()
+            if self.socket not in readable:
+                return []  # Woken without data; the caller rechecks whether it should keep running
+        packets = []
+        for slot in self.slots:
+            try:
+                nbytes = self.socket.recv_into(slot)
+            except (BlockingIOError, socket.timeout):
+                break
+            packets.append(slot[:nbytes])
+        self._backlogged = len(packets) == self.batch_size
+        return packets
 
 
 class UDPEventReceiver:
     """High-performance UDP receiver for neuromorphic events"""
-    def __init__(self, port=9999, buffer_size=20 * 1024 * 1024):  
+    def __init__(self, port=9999, buffer_size=20 * 1024 * 1024, max_x=MAX_EVENT_X, max_y=MAX_EVENT_Y,
+                 cpu_core=None):  
         self.port = port
         self.buffer_size = buffer_size
+        self.cpu_core = cpu_core  # Pin the receive thread to this core (Linux), None to leave it floating
+        self.max_x = max_x  # Inclusive event coordinate bounds
+        self.max_y = max_y
         self.socket = None
         self.running = False
+        # stop() writes to this pair to interrupt the receive thread's wait, so it can block without a timeout
+        self.wakeup_recv = None
+        self.wakeup_send = None
         self.event_data = EventData()
         self.thread = None
-        self.last_buffer_clear = time.time()
-        self.buffer_clear_interval = 5  # Clear buffer every 10ms aggressively to prevent latency buildup
         self.last_stats_time = time.time()
         self.stats_interval = 2.0  # Print stats every 2 seconds like C++
-        self.packet_latencies = []  # Track packet processing latencies
         self.max_latency_samples = 100
+        self.packet_latencies = np.zeros(self.max_latency_samples, dtype=np.float64)  # Ring of recent latencies (us)
+        self.latency_index = 0  # Total samples written; the next slot is latency_index % max_latency_samples
         self.last_throughput_time = time.time()
         self.last_throughput_bytes = 0
         self.current_throughput_mbps = 0.0
+        self.event_dtype = None  # Wire layout, detected from the first packet carrying events
         
     def start(self):
         """Start UDP receiver thread"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             
-            # Set socket options to prevent buffer buildup
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.buffer_size)
-            
-            # Try to get actual buffer size for monitoring
-            actual_buffer_size = self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
-            print(f"Socket buffer size: requested {self.buffer_size / (1024*1024):.1f} MB, actual {actual_buffer_size / (1024*1024):.1f} MB")
+            # Size the kernel receive queue so bursts survive GUI stalls instead of being dropped
+            self._configure_receive_buffer()
             
             self.socket.bind(('127.0.0.1', self.port))
-            self.socket.settimeout(0.05)  # Shorter timeout for more responsive buffer clearing
+            self.wakeup_recv, self.wakeup_send = socket.socketpair()  # Sockets, so select() works on Windows too
             self.running = True
             
             self.thread = threading.Thread(target=self._receive_loop, daemon=True)
@@ -140,29 +507,69 @@ class UDPEventReceiver:
             print(f"Failed to start UDP receiver: {e}")
             return False
     
+    def _configure_receive_buffer(self):
+        """Request a buffer_size kernel receive queue and report what the OS actually granted"""
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.buffer_size)
+        actual_buffer_size = self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        if sys.platform.startswith('linux'):
+            actual_buffer_size //= 2  # Linux reports double the requested size to account for bookkeeping
+            if actual_buffer_size < self.buffer_size:
+                # SO_RCVBUFFORCE bypasses net.core.rmem_max but needs CAP_NET_ADMIN
+                try:
+                    self.socket.setsockopt(socket.SOL_SOCKET, SO_RCVBUFFORCE, self.buffer_size)
+                    actual_buffer_size = self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) // 2
+                except OSError:
+                    print(f"Socket buffer clamped by the kernel - raise it with: "
+                          f"sysctl -w net.core.rmem_max={self.buffer_size}")
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, SO_BUSY_POLL, 50)  # Busy-poll 50us before sleeping
+            except OSError:
+                pass
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, SO_RXQ_OVFL, 1)  # Report kernel queue drops as ancillary data
+            except OSError:
+                pass
+        print(f"Socket buffer size: requested {self.buffer_size / (1024*1024):.1f} MB, actual {actual_buffer_size / (1024*1024):.1f} MB")
+    
     def stop(self):
         """Stop UDP receiver"""
         self.running = False
-        if self.socket:
-            self.socket.close()
+        if self.wakeup_send:
+            try:
+                self.wakeup_send.send(b'\0')
+            except OSError:
+                pass  # Already stopped
         if self.thread:
             self.thread.join()
+        # Close only once the receive thread has left its wait on these sockets
+        for sock in (self.socket, self.wakeup_recv, self.wakeup_send):
+            if sock:
+                sock.close()
         print("UDP receiver stopped")
     
     def _receive_loop(self):
-        """Main UDP receiving loop with periodic buffer clearing"""
-        packets_in_interval = 0
+        """Main UDP receiving loop - drains every queued datagram; real kernel drops are counted, never forced"""
+        self._pin_receive_thread()
+        # None off Linux - fall back to recv_into draining
+        batch_reader = RecvmmsgReader.create(self.socket, wakeup=self.wakeup_recv)
+        if batch_reader is None:
+            batch_reader = RecvIntoReader(self.socket, wakeup=self.wakeup_recv)
         
         while self.running:
             try:
-                data, addr = self.socket.recvfrom(self.buffer_size)
-                self._process_packet(data)
-                self.event_data.stats['packets'] += 1
-                self.event_data.stats['bytes'] += len(data)
-                packets_in_interval += 1
+                packets = batch_reader.receive()
                 
-                # Update throughput calculation like C++ (every 100ms)
+                # One pair of clock reads for the whole batch - the datagrams arrived together
+                received_time = time.monotonic()
                 current_time = time.time()
+                for data in packets:
+                    self._process_packet(data, received_time, current_time)
+                    self.event_data.stats['packets'] += 1
+                    self.event_data.stats['bytes'] += len(data)
+                if isinstance(batch_reader, RecvmmsgReader):
+                    self.event_data.stats['kernel_drops'] = batch_reader.kernel_drops
+                
+                # Update throughput calculation like C++ (every 100ms)
                 if current_time - self.last_throughput_time >= 0.1:  # Every 100ms like C++
                     current_bytes = self.event_data.stats['bytes']
                     bytes_delta = current_bytes - self.last_throughput_bytes
@@ -170,138 +577,106 @@ class UDPEventReceiver:
                     self.last_throughput_time = current_time
                     self.last_throughput_bytes = current_bytes
                 
-                # Immediate buffer clearing after EVERY packet to prevent any buildup
-                if current_time - self.last_buffer_clear >= self.buffer_clear_interval:
-                    self._clear_socket_buffer()
-                    self.last_buffer_clear = current_time
-                
             except socket.timeout:
-                # Use timeout to periodically clear socket buffer if packets are backing up
-                current_time = time.time()
-                if current_time - self.last_buffer_clear >= self.buffer_clear_interval:
-                    self._clear_socket_buffer()
-                    self.last_buffer_clear = current_time
-                    if packets_in_interval > 0:
-                        # Only print if we actually received packets
-                        packets_in_interval = 0
+                # Only raised if the socket was given a timeout; stop() wakes the wait directly
                 continue
             except Exception as e:
                 if self.running:
                     print(f"UDP receive error: {e}")
                 break
     
-    def _process_packet(self, data):
-        """Process received UDP packet containing DVS events"""
-        packet_receive_time = time.time()
+    def _pin_receive_thread(self):
+        """Move the calling thread onto cpu_core and raise it to SCHED_FIFO where permitted"""
+        if self.cpu_core is None or not hasattr(os, 'sched_setaffinity'):
+            return
+        try:
+            os.sched_setaffinity(0, {self.cpu_core})  # pid 0 is the calling thread
+            print(f"UDP receive thread pinned to CPU {self.cpu_core}")
+        except OSError as e:
+            print(f"Could not pin UDP receive thread to CPU {self.cpu_core}: {e}")
+            return
+        try:
+            # Real-time priority keeps the renderer from preempting the drain during bursts (needs CAP_SYS_NICE)
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        except (OSError, AttributeError):
+            pass
+    
+    def _process_packet(self, data, received_time=None, packet_receive_time=None):
+        """Process received UDP packet containing DVS events
+        
+        received_time (time.monotonic) and packet_receive_time (time.time) are the arrival clock
+        samples; the receive loop takes them once per batch and shares them across its packets.
+        """
+        if received_time is None:
+            received_time = time.monotonic()
+        if packet_receive_time is None:
+            packet_receive_time = time.time()
         
         if len(data) < 8:  # Need at least timestamp
             return
         
         try:
             # Extract packet timestamp (first 8 bytes)
-            packet_timestamp = struct.unpack('<Q', data[:8])[0]
+            packet_timestamp = PACKET_HEADER.unpack_from(data, 0)[0]
             
             # Calculate packet latency (timestamp is in microseconds)
             packet_latency = (packet_receive_time * 1000000) - packet_timestamp
-            if len(self.packet_latencies) >= self.max_latency_samples:
-                self.packet_latencies.pop(0)
-            self.packet_latencies.append(packet_latency)
+            self.packet_latencies[self.latency_index % self.max_latency_samples] = packet_latency
+            self.latency_index += 1
             
-            # Extract events (remaining data)
-            event_data = data[8:]
-            # DVSEvent size: timestamp(8) + x(2) + y(2) + polarity(1) = 13 bytes (matches C++ Event struct)
-            event_size = 16
+            if self.event_dtype is None:
+                if len(data) == PACKET_HEADER_SIZE:
+                    return
+                self.event_dtype = self._detect_event_dtype(data, self.max_x, self.max_y)
+                print(f"UDP: Detected {self.event_dtype.itemsize}-byte event layout")
             
-            num_events = len(event_data) // event_size
+            # Decode all events in one call - a zero-copy structured view over the packet payload
+            num_events = (len(data) - PACKET_HEADER_SIZE) // self.event_dtype.itemsize
             
             # Debug output similar to C++ (less frequent)
             if num_events > 0 and self.event_data.stats['packets'] % 50 == 0:
                 print(f"UDP: Received packet with {num_events} events ({len(data)} bytes)")
             
-            # Process events in batch for better performance
-            events_to_add = []
-            for i in range(num_events):
-                offset = i * event_size
-                if offset + event_size <= len(event_data):
-                    event_bytes = event_data[offset:offset + event_size]
-                    if len(event_bytes) >= 13:  # Minimum required bytes for DVSEvent
-                        timestamp = struct.unpack('<Q', event_bytes[0:8])[0]
-                        x = struct.unpack('<H', event_bytes[8:10])[0]  # uint16_t
-                        y = struct.unpack('<H', event_bytes[10:12])[0]  # uint16_t
-                        polarity = struct.unpack('<b', event_bytes[12:13])[0]  # int8_t polarity
-                        
-                        # Validate coordinates (screen bounds check)
-                        if 0 <= x <= 1920 and 0 <= y <= 1080:
-                            events_to_add.append((timestamp, x, y, polarity))
+            events = np.frombuffer(data, dtype=self.event_dtype, count=num_events, offset=PACKET_HEADER_SIZE)
+            if self.event_dtype is not EVENT_DTYPE:
+                if self.event_dtype['x'].itemsize > 2:
+                    # Bounds-check before narrowing uint32 coordinates so out-of-range values cannot wrap into range
+                    events = events[(events['x'] <= self.max_x) & (events['y'] <= self.max_y)]
+                events = events.astype(EVENT_DTYPE)  # Normalize to the aligned native uint16 layout
             
-            # Add events in batch
-            if events_to_add:
-                with self.event_data.lock:
-                    current_time = time.time()
-                    for timestamp, x, y, polarity in events_to_add:
-                        self.event_data.events.append({
-                            'timestamp': timestamp,
-                            'x': x,
-                            'y': y,
-                            'polarity': polarity,
-                            'received_time': current_time
-                        })
-                    self.event_data.stats['events'] += len(events_to_add)
+            # Validate coordinates (screen bounds check) and add events in batch
+            # One arrival stamp per batch; monotonic so window filtering survives wall-clock jumps
+            self.event_data.add_packet_events(events, received_time, self.max_x, self.max_y)
             
-            # Print performance statistics like C++ (every 2 seconds)
-            current_time = time.time()
-            if current_time - self.last_stats_time >= self.stats_interval:
+            # Print performance statistics like C++ (every 2 seconds), reusing the arrival clock sample
+            if packet_receive_time - self.last_stats_time >= self.stats_interval:
                 self._print_performance_stats()
-                self.last_stats_time = current_time
-
-            self._packet_counter = getattr(self, '_packet_counter', 0) + 1
-            if self._packet_counter == 100:
-                with open("udp_packet_100_received.bin", "wb") as f:
-                    f.write(data)
-
-                            
+                self.last_stats_time = packet_receive_time
+            
         except struct.error as e:
             print(f"Packet parsing error: {e}")
         except Exception as e:
             print(f"Unexpected error processing packet: {e}")
     
-    def _clear_socket_buffer(self):
-        """Aggressively clear any backed up packets in socket buffer to prevent latency buildup"""
-        try:
-            cleared_count = 0
-            cleared_bytes = 0
-            # Drain ALL backed up packets with non-blocking calls - no limits for real-time
-            self.socket.setblocking(False)
-            start_time = time.time()
-            
-            while True:
-                try:
-                    data, addr = self.socket.recvfrom(self.buffer_size)
-                    cleared_count += 1
-                    cleared_bytes += len(data)
-                    
-                    # Only break if we've been clearing for more than 50ms to prevent infinite loop
-                    if time.time() - start_time > 0.05:
-                        break
-                        
-                except BlockingIOError:
-                    break
-                    
-            self.socket.setblocking(True) 
-            self.socket.settimeout(0.01)  # Much shorter timeout for more responsive clearing
-            
-            if cleared_count > 0:
-                print(f"AGGRESSIVE CLEAR: Dropped {cleared_count} backed up packets ({cleared_bytes/1024:.1f} KB) to prevent latency")
-                # Reset our stats since we just dropped a lot of data
-                self.last_stats_time = time.time()
-                
-        except Exception as e:
-            # Re-enable blocking mode even if there's an error
-            try:
-                self.socket.setblocking(True)
-                self.socket.settimeout(0.01)
-            except:
-                pass
+    @staticmethod
+    def _detect_event_dtype(data, max_x=MAX_EVENT_X, max_y=MAX_EVENT_Y):
+        """Pick the candidate layout that tiles the payload exactly and decodes the most plausible events"""
+        payload_size = len(data) - PACKET_HEADER_SIZE
+        # The streamer stamps each packet with its first event's timestamp (microseconds)
+        packet_timestamp = np.uint64(PACKET_HEADER.unpack_from(data, 0)[0])
+        best_dtype, best_score = EVENT_DTYPE, -1
+        for dtype in CANDIDATE_EVENT_DTYPES:
+            if payload_size % dtype.itemsize:
+                continue
+            events = np.frombuffer(data, dtype=dtype, offset=PACKET_HEADER_SIZE)
+            timestamps = events['timestamp']
+            near_packet = np.maximum(timestamps, packet_timestamp) - np.minimum(timestamps, packet_timestamp) < 10_000_000
+            plausible = np.count_nonzero(near_packet & (events['x'] <= max_x) & (events['y'] <= max_y) &
+                                         ((events['polarity'] == 0) | (events['polarity'] == 1)))
+            score = plausible / len(events)  # A fraction, so a 2x finer stride cannot win on padding rows
+            if score > best_score:
+                best_dtype, best_score = dtype, score
+        return best_dtype
     
     def _print_performance_stats(self):
         """Print performance statistics matching C++ UDP streaming output format"""
@@ -319,19 +694,123 @@ class UDPEventReceiver:
             # Calculate latency stats
             avg_latency = 0
             max_latency = 0
-            if self.packet_latencies:
-                avg_latency = sum(self.packet_latencies) / len(self.packet_latencies)
-                max_latency = max(self.packet_latencies)
+            if self.latency_index:
+                latencies = self.packet_latencies[:min(self.latency_index, self.max_latency_samples)]
+                avg_latency = latencies.mean()
+                max_latency = latencies.max()
             
-            print(f"\n=== Python UDP Receiver Performance ===")
-            print(f"Events/sec: {events_per_sec:.0f} | Packets: {total_packets}")
-            print(f"Throughput: {self.current_throughput_mbps:.2f} MB/s (windowed) | Avg: {throughput_mbps:.2f} MB/s")
-            print(f"Events processed: {total_events} | Bytes: {total_bytes / 1024:.1f} KB")
-            print(f"Latency: avg {avg_latency/1000:.1f}ms | max {max_latency/1000:.1f}ms")
+            # One write for the whole block: this runs on the receive thread, between datagrams
+            print(f"\n=== Python UDP Receiver Performance ===\n"
+                  f"Events/sec: {events_per_sec:.0f} | Packets: {total_packets}\n"
+                  f"Throughput: {self.current_throughput_mbps:.2f} MB/s (windowed) | Avg: {throughput_mbps:.2f} MB/s\n"
+                  f"Events processed: {total_events} | Bytes: {total_bytes / 1024:.1f} KB\n"
+                  f"Latency: avg {avg_latency/1000:.1f}ms | max {max_latency/1000:.1f}ms\n"
+                  f"Kernel drops: {self.event_data.stats['kernel_drops']}")
         else:
             print(f"Python UDP Receiver: {total_events} events, packets: {total_packets}")
 
 
+class PointSpriteRenderer:
+    """Draws all active dots with one glDrawArrays(GL_POINTS) call from streamed vertex buffers.
+    
+    ImGui's Python bindings expose no draw callbacks, so the points are drawn with
+    raw OpenGL right after ImGui has rendered, scissored to the canvas rectangle.
+    """
+    VERTEX_SHADER = """
+    #version 330 core
+    layout(location = 0) in vec2 position;
+    layout(location = 1) in vec4 color;
+    uniform vec2 display_size;
+    uniform float point_size;
+    out vec4 frag_color;
+    void main() {
+        vec2 ndc = position / display_size * 2.0 - 1.0;
+        gl_Position = vec4(ndc.x, -ndc.y, 0.0, 1.0);
+        gl_PointSize = point_size;
+        frag_color = color;
+    }
+    """
+    FRAGMENT_SHADER = """
+    #version 330 core
+    in vec4 frag_color;
+    out vec4 out_color;
+    void main() {
+        // Round sprite to match add_circle_filled
+        if (length(gl_PointCoord - vec2(0.5)) > 0.5) discard;
+        out_color = frag_color;
+    }
+    """
+    
+    def __init__(self):
+        self.program = self._link_program(self.VERTEX_SHADER, self.FRAGMENT_SHADER)
+        self.display_size_location = glGetUniformLocation(self.program, "display_size")
+        self.point_size_location = glGetUniformLocation(self.program, "point_size")
+        
+        self.vao = glGenVertexArrays(1)
+        self.position_vbo, self.color_vbo = glGenBuffers(2)
+        glBindVertexArray(self.vao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.position_vbo)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, ctypes.c_void_p(0))
+        glBindBuffer(GL_ARRAY_BUFFER, self.color_vbo)
+        glEnableVertexAttribArray(1)
+        glVertexAttribPointer(1, 4, GL_UNSIGNED_BYTE, GL_TRUE, 0, ctypes.c_void_p(0))
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+    
+    @staticmethod
+    def _link_program(vertex_source, fragment_source):
+        program = glCreateProgram()
+        for shader_type, source in ((GL_VERTEX_SHADER, vertex_source), (GL_FRAGMENT_SHADER, fragment_source)):
+            shader = glCreateShader(shader_type)
+            glShaderSource(shader, source)
+            glCompileShader(shader)
+            if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+                raise RuntimeError(glGetShaderInfoLog(shader).decode())
+            glAttachShader(program, shader)
+            glDeleteShader(shader)
+        glLinkProgram(program)
+        if not glGetProgramiv(program, GL_LINK_STATUS):
+            raise RuntimeError(glGetProgramInfoLog(program).decode())
+        return program
+    
+    def draw(self, positions, colors, clip_rect, point_size):
+        """Draw (N, 2) float32 ImGui-space positions with N ImU32 (RGBA byte order) colors inside clip_rect"""
+        count = len(positions)
+        if count == 0:
+            return
+        
+        io = imgui.get_io()
+        fb_scale_x, fb_scale_y = io.display_fb_scale
+        fb_width = int(io.display_size.x * fb_scale_x)
+        fb_height = int(io.display_size.y * fb_scale_y)
+        
+        # Orphan and refill the buffers every frame - the classic streaming-VBO pattern
+        glBindBuffer(GL_ARRAY_BUFFER, self.position_vbo)
+        glBufferData(GL_ARRAY_BUFFER, positions.nbytes, positions, GL_STREAM_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, self.color_vbo)
+        glBufferData(GL_ARRAY_BUFFER, colors.nbytes, colors, GL_STREAM_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        x0, y0, x1, y1 = clip_rect
+        glViewport(0, 0, fb_width, fb_height)
+        glEnable(GL_SCISSOR_TEST)
+        glScissor(int(x0 * fb_scale_x), int(fb_height - y1 * fb_scale_y),
+                  int((x1 - x0) * fb_scale_x), int((y1 - y0) * fb_scale_y))
+        glEnable(GL_PROGRAM_POINT_SIZE)
+        
+        glUseProgram(self.program)
+        glUniform2f(self.display_size_location, io.display_size.x, io.display_size.y)
+        glUniform1f(self.point_size_location, point_size * fb_scale_x)
+        glBindVertexArray(self.vao)
+        glDrawArrays(GL_POINTS, 0, count)
+        
+        glBindVertexArray(0)
+        glUseProgram(0)
+        glDisable(GL_PROGRAM_POINT_SIZE)
+        glDisable(GL_SCISSOR_TEST)
+
+
 class NeuromorphicVisualizer:
     """ImGui-based neuromorphic event visualizer matching C++ implementation"""
     def __init__(self, width=1920, height=1080, canvas_width=800, canvas_height=600, use_gpu=False):
@@ -344,15 +823,44 @@ class NeuromorphicVisualizer:
         self.use_gpu = use_gpu and GPU_AVAILABLE
         if self.use_gpu:
             print("GPU acceleration enabled")
+        self.gpu_coords = None  # Device-side coordinate buffer reused across frames
+        self.gpu_host_coords = None  # Pinned host staging buffer for the transfers
+        self.gpu_screen = None  # CuPy only: raw uint16 screen coords, device and pinned host side
+        self.gpu_host_screen = None
+        self.gpu_stream = None
         
         # Event visualization - matching C++ implementation
-        self.active_dots = []  # List of (event, fade_time) tuples
+        # Active dots as parallel arrays: screen coords, canvas coords, polarity and fade alpha
+        self.active_x = np.empty(0, dtype=np.uint16)
+        self.active_y = np.empty(0, dtype=np.uint16)
+        self.active_canvas_x = np.empty(0, dtype=np.float32)
+        self.active_canvas_y = np.empty(0, dtype=np.float32)
+        self.active_polarity = np.empty(0, dtype=np.int8)
+        self.active_alpha = np.empty(0, dtype=np.float32)
         self.max_active_dots = 100000
         
+        # Fade alpha output sized for max_active_dots, reused every frame instead of reallocated
+        self.alpha_buffer = np.empty(self.max_active_dots, dtype=np.float32)
+        
+        # Events still inside the fade window, carried across frames and topped up from the ring.
+        # Canvas coords are computed once per event at ingest and only redone when the canvas scale changes
+        self.recent_events = {
+            'x': np.empty(0, dtype=np.uint16),
+            'y': np.empty(0, dtype=np.uint16),
+            'polarity': np.empty(0, dtype=np.int8),
+            'received_time': np.empty(0, dtype=np.float64),
+            'canvas_x': np.empty(0, dtype=np.float32),
+            'canvas_y': np.empty(0, dtype=np.float32)
+        }
+        self.canvas_scale = None  # (scale_x, scale_y) the retained canvas coords were computed with
+        
         # Plot data for event capture rate
-        self.plot_times = deque(maxlen=300)  # 5 seconds at 60fps
-        self.plot_event_counts = deque(maxlen=300)
-        self.last_plot_update = time.time()
+        self.plot_capacity = 300  # 5 seconds at 60fps
+        self.plot_times = np.zeros(self.plot_capacity, dtype=np.float64)
+        self.plot_event_counts = np.zeros(self.plot_capacity, dtype=np.int64)
+        self.plot_head = 0  # Next ring slot to write
+        self.plot_size = 0
+        self.last_plot_update = time.monotonic()
         self.plot_update_interval = 1.0 / 60.0  # 60 FPS plot updates
         
         # Statistics
@@ -360,18 +868,26 @@ class NeuromorphicVisualizer:
             'fps': 0.0,
             'events_per_sec': 0.0,
             'active_dots': 0,
-            'total_events': 0
+            'total_events': 0,
+            'dropped_events': 0,
+            'kernel_drops': 0
         }
         
         # Timing for FPS calculation
-        self.last_frame_time = time.time()
-        self.frame_times = deque(maxlen=60)
+        self.last_frame_time = time.monotonic()
+        self.frame_interval = 0.0  # Exponential moving average of seconds per frame
         
-        # Plot texture for matplotlib integration
-        self.plot_texture_id = None
         self.plot_width = 400
         self.plot_height = 200
         
+        # Batched GL point renderer, created lazily once the GL context is current
+        self.point_renderer = None
+        self.point_renderer_failed = False
+        self.dot_position_buffer = np.empty((self.max_active_dots, 2), dtype=np.float32)
+        self.dot_positions = self.dot_position_buffer[:0]
+        self.dot_colors = np.empty(0, dtype=np.uint32)
+        self.canvas_rect = (0.0, 0.0, 0.0, 0.0)
+        
     def screen_to_canvas(self, screen_x, screen_y):
         """Convert screen coordinates to canvas coordinates - matching C++ implementation"""
         if self.screen_width > 0 and self.screen_height > 0:
@@ -381,190 +897,133 @@ class NeuromorphicVisualizer:
         else:
             return (screen_x, screen_y)
     
-    def screen_to_canvas_batch_gpu(self, events):
-        """Enhanced GPU-accelerated batch processing with CuPy or PyTorch"""
-        if not self.use_gpu or not events:
-            return events
+    def screen_to_canvas_batch_gpu(self, x, y):
+        """GPU-accelerated coordinate transform with CuPy or PyTorch
         
+        Only the coordinates cross the bus: they are staged in a pinned host buffer so both copies
+        are plain DMA transfers, and upload, scale and readback are queued on one non-blocking stream.
+        All buffers persist across calls. Returns (canvas_x, canvas_y) float32 arrays.
+        """
         try:
-            # Extract all event data for GPU processing
-            coords = np.array([(e['x'], e['y']) for e in events], dtype=np.float32)
-            alphas = np.array([e.get('alpha', 1.0) for e in events], dtype=np.float32)
-            polarities = np.array([e['polarity'] for e in events], dtype=np.int8)
+            n = len(x)
+            scale_x, scale_y = self.screen_to_canvas(1.0, 1.0)
+            if self.gpu_coords is None or len(self.gpu_coords) < n:
+                size = max(n, self.max_active_dots)
+                if GPU_BACKEND == "cupy":
+                    # Raw uint16 pairs go up (half the bytes of float32), canvas floats come back
+                    self.gpu_screen = cp.empty((size, 2), dtype=cp.uint16)
+                    self.gpu_host_screen = cupyx.empty_pinned((size, 2), dtype=np.uint16)
+                    self.gpu_coords = cp.empty((size, 2), dtype=cp.float32)
+                    self.gpu_host_coords = cupyx.empty_pinned((size, 2), dtype=np.float32)
+                    self.gpu_stream = cp.cuda.Stream(non_blocking=True)
+                elif GPU_BACKEND == "pytorch":
+                    self.gpu_coords = torch.empty((size, 2), dtype=torch.float32, device='cuda')
+                    self.gpu_host_coords = torch.empty((size, 2), dtype=torch.float32).pin_memory()
+                    self.gpu_stream = torch.cuda.Stream()
             
             if GPU_BACKEND == "cupy":
-                # CuPy implementation
-                coords_gpu = cp.asarray(coords)
-                alphas_gpu = cp.asarray(alphas)
-                polarities_gpu = cp.asarray(polarities)
-                
-                # GPU coordinate transformation
-                scale_x = float(self.canvas_width) / float(self.screen_width)
-                scale_y = float(self.canvas_height) / float(self.screen_height)
-                coords_gpu[:, 0] *= scale_x
-                coords_gpu[:, 1] *= scale_y
-                
-                # GPU alpha fade calculations
-                current_time = time.time()
-                if hasattr(self, 'last_gpu_time'):
-                    dt = current_time - self.last_gpu_time
-                    alphas_gpu = cp.maximum(0.0, alphas_gpu - dt / DOT_FADE_DURATION)
-                self.last_gpu_time = current_time
-                
-                # GPU filtering for bounds checking
-                valid_mask = ((coords_gpu[:, 0] >= 0) & (coords_gpu[:, 0] < self.canvas_width) & 
-                             (coords_gpu[:, 1] >= 0) & (coords_gpu[:, 1] < self.canvas_height) &
-                             (alphas_gpu > 0.01))
-                
-                # Filter events on GPU
-                coords_filtered = coords_gpu[valid_mask]
-                alphas_filtered = alphas_gpu[valid_mask]
-                polarities_filtered = polarities_gpu[valid_mask]
-                
-                # Move back to CPU
-                coords_cpu = cp.asnumpy(coords_filtered)
-                alphas_cpu = cp.asnumpy(alphas_filtered)
-                polarities_cpu = cp.asnumpy(polarities_filtered)
+                screen = self.gpu_host_screen[:n]
+                screen[:, 0] = x
+                screen[:, 1] = y
+                host = self.gpu_host_coords[:n]
+                with self.gpu_stream:
+                    screen_gpu = self.gpu_screen[:n]
+                    coords_gpu = self.gpu_coords[:n]
+                    screen_gpu.set(screen, stream=self.gpu_stream)
+                    
+                    # GPU coordinate transformation - a single fused kernel launch
+                    CANVAS_TRANSFORM_KERNEL(screen_gpu, np.float32(scale_x), np.float32(scale_y), coords_gpu)
+                    coords_gpu.get(stream=self.gpu_stream, out=host)
+                self.gpu_stream.synchronize()
                 
             elif GPU_BACKEND == "pytorch":
-                # PyTorch implementation
-                coords_gpu = torch.from_numpy(coords).cuda()
-                alphas_gpu = torch.from_numpy(alphas).cuda()
-                polarities_gpu = torch.from_numpy(polarities).cuda()
-                
-                # GPU coordinate transformation
-                scale_x = float(self.canvas_width) / float(self.screen_width)
-                scale_y = float(self.canvas_height) / float(self.screen_height)
-                coords_gpu[:, 0] *= scale_x
-                coords_gpu[:, 1] *= scale_y
-                
-                # GPU alpha fade calculations
-                current_time = time.time()
-                if hasattr(self, 'last_gpu_time'):
-                    dt = current_time - self.last_gpu_time
-                    alphas_gpu = torch.clamp(alphas_gpu - dt / DOT_FADE_DURATION, min=0.0)
-                self.last_gpu_time = current_time
-                
-                # GPU filtering for bounds checking
-                valid_mask = ((coords_gpu[:, 0] >= 0) & (coords_gpu[:, 0] < self.canvas_width) & 
-                             (coords_gpu[:, 1] >= 0) & (coords_gpu[:, 1] < self.canvas_height) &
-                             (alphas_gpu > 0.01))
-                
-                # Filter events on GPU
-                coords_filtered = coords_gpu[valid_mask]
-                alphas_filtered = alphas_gpu[valid_mask]
-                polarities_filtered = polarities_gpu[valid_mask]
-                
-                # Move back to CPU
-                coords_cpu = coords_filtered.cpu().numpy()
-                alphas_cpu = alphas_filtered.cpu().numpy()
-                polarities_cpu = polarities_filtered.cpu().numpy()
-            
-            # Update events with GPU-processed data
-            processed_events = []
-            for i in range(len(coords_cpu)):
-                event = {
-                    'canvas_x': coords_cpu[i, 0],
-                    'canvas_y': coords_cpu[i, 1], 
-                    'alpha': alphas_cpu[i],
-                    'polarity': polarities_cpu[i]
-                }
-                processed_events.append(event)
+                host_tensor = self.gpu_host_coords[:n]
+                host = host_tensor.numpy()  # Shares the pinned memory
+                host[:, 0] = x
+                host[:, 1] = y
+                with torch.cuda.stream(self.gpu_stream):
+                    coords_gpu = self.gpu_coords[:n]
+                    coords_gpu.copy_(host_tensor, non_blocking=True)
+                    
+                    # GPU coordinate transformation
+                    coords_gpu *= torch.tensor((scale_x, scale_y), dtype=torch.float32, device='cuda')
+                    host_tensor.copy_(coords_gpu, non_blocking=True)
+                self.gpu_stream.synchronize()
             
-            return processed_events
+            # The staging buffer is reused by the next call, so hand back copies
+            return host[:, 0].copy(), host[:, 1].copy()
         except Exception as e:
             print(f"GPU processing failed, falling back to CPU: {e}")
-            return events
+            return self.screen_to_canvas(x.astype(np.float32), y.astype(np.float32))
         
+    def _events_to_canvas(self, x, y):
+        """Canvas coords for event screen coords, on the GPU for large batches when enabled"""
+        if self.use_gpu and len(x) >= GPU_MIN_BATCH:
+            return self.screen_to_canvas_batch_gpu(x, y)
+        return self.screen_to_canvas(x.astype(np.float32), y.astype(np.float32))
+    
     def update_events(self, event_data):
-        """Parallelized event processing with optional GPU acceleration"""
-        current_time = time.time()
+        """Vectorized event fade processing with optional GPU acceleration"""
+        current_time = time.monotonic()
         
         # Get recent events (last 100ms for active dots - matching C++ DOT_FADE_DURATION)
-        recent_events = event_data.get_recent_events(time_window=0.1)
-        
-        # Update active dots with proper fade timing - parallelized for performance
-        self.active_dots = []
-        if recent_events:  # Only process if we have events
-            # Process ALL events (no culling as requested)
-            max_events_to_process = min(len(recent_events), self.max_active_dots)
-            recent_events = recent_events[-max_events_to_process:]
+        # Only events published since the last frame are copied out of the ring. received_time is
+        # non-decreasing, so the still-fading dots are one suffix found with a single binary search
+        new_events = event_data.get_new_events()
+        
+        scale = self.screen_to_canvas(1.0, 1.0)
+        if scale != self.canvas_scale:
+            # Canvas resized: rescale the retained dots once, later frames only transform new events
+            self.canvas_scale = scale
+            recent = self.recent_events
+            recent['canvas_x'], recent['canvas_y'] = self._events_to_canvas(recent['x'], recent['y'])
+        new_events['canvas_x'], new_events['canvas_y'] = self._events_to_canvas(new_events['x'], new_events['y'])
+        
+        combined = {name: np.concatenate((column, new_events[name])) for name, column in self.recent_events.items()}
+        start = int(np.searchsorted(combined['received_time'], current_time - DOT_FADE_DURATION))
+        start = max(start, len(combined['received_time']) - self.max_active_dots)
+        recent_events = {name: column[start:] for name, column in combined.items()}
+        self.recent_events = recent_events
+        
+        # Process ALL events (no culling as requested) - every one of them is inside the fade window
+        if NUMBA_AVAILABLE:
+            # Single compiled parallel pass into the recycled alpha buffer - alpha is a view of its first rows
+            count = len(recent_events['received_time'])
+            _fade_events(recent_events['received_time'], current_time, DOT_FADE_DURATION, self.alpha_buffer)
+            alpha = self.alpha_buffer[:count]
+        else:
+            ages = current_time - recent_events['received_time']
             
-            if self.use_gpu and len(recent_events) > 1000:
-                # Use GPU acceleration for large event batches
-                temp_events = []
-                for event in recent_events:
-                    age = current_time - event['received_time']
-                    if age <= DOT_FADE_DURATION:
-                        alpha = (DOT_FADE_DURATION - age) / DOT_FADE_DURATION
-                        alpha = max(0.0, min(1.0, alpha))
-                        temp_events.append({
-                            'x': event['x'], 'y': event['y'], 
-                            'polarity': event['polarity'], 'alpha': alpha
-                        })
-                
-                # GPU batch processing
-                if temp_events:
-                    processed_events = self.screen_to_canvas_batch_gpu(temp_events)
-                    self.active_dots = processed_events
-                    
-            elif PARALLEL_AVAILABLE and len(recent_events) > 100:
-                # Use parallel processing for medium-large batches
-                def process_event_chunk(events_chunk):
-                    chunk_dots = []
-                    for event in events_chunk:
-                        age = current_time - event['received_time']
-                        if age <= DOT_FADE_DURATION:
-                            alpha = (DOT_FADE_DURATION - age) / DOT_FADE_DURATION
-                            alpha = max(0.0, min(1.0, alpha))
-                            chunk_dots.append({
-                                'x': event['x'], 'y': event['y'], 
-                                'polarity': event['polarity'], 'alpha': alpha
-                            })
-                    return chunk_dots
-                
-                # Split events into chunks for parallel processing
-                chunk_size = max(50, len(recent_events) // 4)
-                event_chunks = [recent_events[i:i+chunk_size] for i in range(0, len(recent_events), chunk_size)]
-                
-                with ThreadPoolExecutor(max_workers=4) as executor:
-                    chunk_results = list(executor.map(process_event_chunk, event_chunks))
-                
-                # Flatten results
-                for chunk_dots in chunk_results:
-                    self.active_dots.extend(chunk_dots)
-            else:
-                # Sequential processing for small batches
-                for event in recent_events:
-                    age = current_time - event['received_time']
-                    if age <= DOT_FADE_DURATION:
-                        alpha = (DOT_FADE_DURATION - age) / DOT_FADE_DURATION
-                        alpha = max(0.0, min(1.0, alpha))
-                        
-                        self.active_dots.append({
-                            'x': event['x'], 'y': event['y'], 
-                            'polarity': event['polarity'], 'alpha': alpha
-                        })
+            # Fade alpha for every event at once
+            alpha = np.clip(1.0 - ages * INV_DOT_FADE_DURATION, 0.0, 1.0).astype(np.float32)
+        
+        self.active_x, self.active_y = recent_events['x'], recent_events['y']
+        self.active_canvas_x, self.active_canvas_y = recent_events['canvas_x'], recent_events['canvas_y']
+        self.active_polarity, self.active_alpha = recent_events['polarity'], alpha
         
         # Update performance stats
-        self.performance_stats['active_dots'] = len(self.active_dots)
+        self.performance_stats['active_dots'] = len(self.active_x)
         self.performance_stats['total_events'] = event_data.stats['events']
+        self.performance_stats['dropped_events'] = event_data.dropped_events
+        self.performance_stats['kernel_drops'] = event_data.stats['kernel_drops']
         
-        # Calculate FPS (less frequent updates)
-        self.frame_times.append(current_time)
-        if len(self.frame_times) > 1:
-            fps = len(self.frame_times) / (self.frame_times[-1] - self.frame_times[0])  
-            self.performance_stats['fps'] = fps
+        # Calculate FPS from a running average of the frame interval - O(1) state, no history kept
+        dt = current_time - self.last_frame_time
+        self.last_frame_time = current_time
+        self.frame_interval = dt if self.frame_interval == 0.0 else 0.9 * self.frame_interval + 0.1 * dt
+        if self.frame_interval > 0.0:
+            self.performance_stats['fps'] = 1.0 / self.frame_interval
         
         # Update plot data (less frequent updates)
         if current_time - self.last_plot_update >= self.plot_update_interval:
-            self.plot_times.append(current_time)
-            
             # Count events in last second
-            one_sec_ago = current_time - 1.0
-            recent_events_1sec = [e for e in recent_events if e['received_time'] >= one_sec_ago]
-            self.plot_event_counts.append(len(recent_events_1sec))
-            self.performance_stats['events_per_sec'] = len(recent_events_1sec)
+            recent_events_1sec = event_data.count_events_since(current_time - 1.0)
+            
+            self.plot_times[self.plot_head] = current_time
+            self.plot_event_counts[self.plot_head] = recent_events_1sec
+            self.plot_head = (self.plot_head + 1) % self.plot_capacity
+            self.plot_size = min(self.plot_size + 1, self.plot_capacity)
+            self.performance_stats['events_per_sec'] = recent_events_1sec
             
             self.last_plot_update = current_time
     
@@ -597,38 +1056,56 @@ class NeuromorphicVisualizer:
         draw_list.add_rect_filled(
             canvas_pos[0], canvas_pos[1],
             canvas_pos[0] + canvas_size[0], canvas_pos[1] + canvas_size[1],
-            imgui.get_color_u32_rgba(0.08, 0.08, 0.08, 1.0)
+            BACKGROUND_COLOR
         )
         
         # Draw canvas border
         draw_list.add_rect(
             canvas_pos[0], canvas_pos[1],
             canvas_pos[0] + canvas_size[0], canvas_pos[1] + canvas_size[1],
-            imgui.get_color_u32_rgba(0.4, 0.4, 0.4, 1.0)
+            BORDER_COLOR
         )
 
-        # GPU-optimized rendering: use precomputed canvas coordinates if available
+        if self.point_renderer is None and not self.point_renderer_failed:
+            try:
+                self.point_renderer = PointSpriteRenderer()
+            except Exception as e:
+                print(f"GL point renderer unavailable, falling back to ImGui circles: {e}")
+                self.point_renderer_failed = True
         
-        # Draw active dots - matching C++ implementation exactly
-        for dot in self.active_dots:
-            # Convert screen coordinates to canvas coordinates
-            canvas_x, canvas_y = self.screen_to_canvas(dot['x'], dot['y'])
-            
-            screen_x = canvas_pos[0] + canvas_x
-            screen_y = canvas_pos[1] + canvas_y
-            
-            # Color based on polarity with alpha - matching C++ exactly
-            if dot['polarity'] > 0:
-                color = imgui.get_color_u32_rgba(0, int(255 * dot['alpha']), 0, 255)  # Green for positive
-            else:
-                color = imgui.get_color_u32_rgba(int(255 * dot['alpha']), 0, 0, 255)  # Red for negative
-            
-            # Draw dot with constant size - matching C++ DOT_SIZE
-            draw_list.add_circle_filled(screen_x, screen_y, DOT_SIZE, color)
+        # Offset every dot to screen space in one pass - both draw paths consume these positions
+        count = len(self.active_x)
+        self.dot_positions = self.dot_position_buffer[:count]
+        self.dot_positions[:, 0] = canvas_pos[0] + self.active_canvas_x
+        self.dot_positions[:, 1] = canvas_pos[1] + self.active_canvas_y
+        self.dot_colors = self._dot_colors()
+        
+        if self.point_renderer is not None:
+            # draw_dots() submits the packed arrays in one GL call after ImGui renders
+            self.canvas_rect = (canvas_pos[0], canvas_pos[1],
+                                canvas_pos[0] + canvas_size[0], canvas_pos[1] + canvas_size[1])
+        else:
+            # Draw active dots - matching C++ implementation exactly
+            for (screen_x, screen_y), color in zip(self.dot_positions.tolist(), self.dot_colors.tolist()):
+                # Draw dot with constant size - matching C++ DOT_SIZE
+                draw_list.add_circle_filled(screen_x, screen_y, DOT_SIZE, color)
         
         # Reserve space for canvas
         imgui.dummy(canvas_size[0], canvas_size[1])
     
+    def _dot_colors(self):
+        """ImU32 color per active dot, by table lookup on polarity and quantized alpha"""
+        intensity = (255 * self.active_alpha).astype(np.uint8)
+        return np.where(self.active_polarity > 0, POSITIVE_DOT_COLORS[intensity], NEGATIVE_DOT_COLORS[intensity])
+    
+    def draw_dots(self):
+        """Submit the dots packed by render_neuromorphic_canvas - call after ImGui has rendered"""
+        if self.point_renderer is not None:
+            # DOT_SIZE is the circle radius, point size is the sprite diameter
+            self.point_renderer.draw(self.dot_positions, self.dot_colors, self.canvas_rect, DOT_SIZE * 2.0)
+        # Consume the batch: a frame that skips the canvas (e.g. window collapsed) must not redraw stale dots
+        self.dot_positions = self.dot_position_buffer[:0]
+    
     def render_statistics_panel(self):
         """Render statistics panel"""
         if imgui.collapsing_header("Statistics"):
@@ -636,21 +1113,32 @@ class NeuromorphicVisualizer:
             imgui.text(f"Events/sec: {self.performance_stats['events_per_sec']:.0f}")
             imgui.text(f"Active dots: {self.performance_stats['active_dots']}")
             imgui.text(f"Total events: {self.performance_stats['total_events']}")
+            imgui.text(f"Dropped: {self.performance_stats['dropped_events']}")
+            imgui.text(f"Kernel drops: {self.performance_stats['kernel_drops']}")
             
             # Add debug information
-            if len(self.active_dots) > 0:
-                imgui.text(f"Sample event: ({self.active_dots[0]['x']}, {self.active_dots[0]['y']})")
-                imgui.text(f"Sample polarity: {self.active_dots[0]['polarity']}")
-                imgui.text(f"Sample alpha: {self.active_dots[0]['alpha']:.2f}")
+            if len(self.active_x) > 0:
+                imgui.text(f"Sample event: ({self.active_x[0]}, {self.active_y[0]})")
+                imgui.text(f"Sample polarity: {self.active_polarity[0]}")
+                imgui.text(f"Sample alpha: {self.active_alpha[0]:.2f}")
             
             if imgui.button("Clear Events"):
                 # Signal to clear events (would need event_data reference)
                 pass
     
+    def _plot_history(self):
+        """Return (times, counts) from the plot ring, oldest first"""
+        if self.plot_size < self.plot_capacity:
+            return self.plot_times[:self.plot_size], self.plot_event_counts[:self.plot_size]
+        # Full ring: unroll the two contiguous halves instead of gathering through an index array
+        head = self.plot_head
+        return (np.concatenate((self.plot_times[head:], self.plot_times[:head])),
+                np.concatenate((self.plot_event_counts[head:], self.plot_event_counts[:head])))
+    
     def render_simple_plot_panel(self):
         """Render simple line plot of events per second vs time"""
         if imgui.collapsing_header("Events Per Second (5s window)"):
-            if len(self.plot_times) > 1 and len(self.plot_event_counts) > 1:
+            if self.plot_size > 1:
                 # Get ImGui drawing area
                 draw_list = imgui.get_window_draw_list()
                 canvas_pos = imgui.get_cursor_screen_pos()
@@ -661,66 +1149,50 @@ class NeuromorphicVisualizer:
                 draw_list.add_rect_filled(
                     canvas_pos[0], canvas_pos[1],
                     canvas_pos[0] + plot_width, canvas_pos[1] + plot_height,
-                    imgui.get_color_u32_rgba(0.08, 0.08, 0.08, 1.0)
+                    BACKGROUND_COLOR
                 )
                 
                 # Draw border
                 draw_list.add_rect(
                     canvas_pos[0], canvas_pos[1],
                     canvas_pos[0] + plot_width, canvas_pos[1] + plot_height,
-                    imgui.get_color_u32_rgba(0.4, 0.4, 0.4, 1.0)
+                    BORDER_COLOR
                 )
                 
-                # Calculate data ranges with proper bounds checking
-                if self.plot_times and self.plot_event_counts:
-                    start_time = self.plot_times[0]
-                    rel_times = [(t - start_time) for t in self.plot_times]
-                    
-                    time_range = max(rel_times) - min(rel_times) if len(rel_times) > 1 else 5.0
-                    count_range = max(self.plot_event_counts) - min(self.plot_event_counts) if len(self.plot_event_counts) > 1 else 1000
-                    
-                    if time_range == 0:
-                        time_range = 5.0
-                    if count_range == 0:
-                        count_range = 1000
-                    
-                    # Draw line plot with proper bounds checking
-                    points = []
-                    for i in range(min(len(rel_times), len(self.plot_event_counts))):
-                        # Scale to plot area with bounds checking
-                        x = canvas_pos[0] + (rel_times[i] / time_range) * plot_width
-                        y = canvas_pos[1] + plot_height - (self.plot_event_counts[i] / count_range) * plot_height
-                        
-                        # Clamp to plot bounds
-                        x = max(canvas_pos[0], min(canvas_pos[0] + plot_width, x))
-                        y = max(canvas_pos[1], min(canvas_pos[1] + plot_height, y))
-                        
-                        points.append((x, y))
-                    
-                    # Draw connected lines
-                    for i in range(len(points) - 1):
-                        draw_list.add_line(
-                            points[i][0], points[i][1],
-                            points[i + 1][0], points[i + 1][1],
-                            imgui.get_color_u32_rgba(0, 1, 0, 1.0), 2.0
-                        )
-                    
-                    # Draw current value indicator
-                    if points:
-                        last_point = points[-1]
-                        draw_list.add_circle_filled(
-                            last_point[0], last_point[1], 3.0,
-                            imgui.get_color_u32_rgba(1, 1, 0, 1.0)
-                        )
+                # Calculate data ranges with one numpy pass per statistic
+                times, counts = self._plot_history()
+                rel_times = times - times[0]
+                
+                time_range = rel_times[-1] - rel_times[0]
+                count_min, count_max = counts.min(), counts.max()
+                count_range = count_max - count_min
+                
+                if time_range == 0:
+                    time_range = 5.0
+                if count_range == 0:
+                    count_range = 1000
+                
+                # Scale to plot area and clamp to plot bounds
+                points = np.empty((len(counts), 2), dtype=np.float32)
+                points[:, 0] = canvas_pos[0] + (rel_times / time_range) * plot_width
+                points[:, 1] = canvas_pos[1] + plot_height - (counts / count_range) * plot_height
+                np.clip(points, (canvas_pos[0], canvas_pos[1]),
+                        (canvas_pos[0] + plot_width, canvas_pos[1] + plot_height), out=points)
+                points = points.tolist()  # add_polyline takes a list; one C-level conversion for all points
+                
+                # Draw connected lines in a single draw-list call
+                draw_list.add_polyline(points, PLOT_LINE_COLOR, 0, 2.0)
+                
+                # Draw current value indicator
+                draw_list.add_circle_filled(points[-1][0], points[-1][1], 3.0, PLOT_MARKER_COLOR)
                 
                 # Reserve space for plot
                 imgui.dummy(plot_width, plot_height)
                 
                 # Show current statistics
                 imgui.text(f"Current: {self.performance_stats['events_per_sec']:.0f} events/sec")
-                if self.plot_event_counts:
-                    imgui.text(f"Max: {max(self.plot_event_counts):.0f} events/sec")
-                    imgui.text(f"Avg: {sum(self.plot_event_counts) / len(self.plot_event_counts):.0f} events/sec")
+                imgui.text(f"Max: {count_max:.0f} events/sec")
+                imgui.text(f"Avg: {counts.mean():.0f} events/sec")
             else:
                 imgui.text("Collecting data...")
 
@@ -757,6 +1229,8 @@ def init_glfw_imgui():
 
 def main_loop(window, impl, receiver, visualizer):
     """Main application loop"""
+    # Window geometry and column width persist in ImGui state, so they are only submitted on the first frame
+    layout_pending = True
     while not glfw.window_should_close(window):
         glfw.poll_events()
         impl.process_inputs()
@@ -768,8 +1242,9 @@ def main_loop(window, impl, receiver, visualizer):
         imgui.new_frame()
         
         # Main window
-        imgui.set_next_window_position(10, 10)
-        imgui.set_next_window_size(1380, 880)
+        if layout_pending:
+            imgui.set_next_window_position(10, 10)
+            imgui.set_next_window_size(1380, 880)
         
         expanded, opened = imgui.begin("Neuromorphic Event Visualizer", True, 
                                      imgui.WINDOW_NO_RESIZE | imgui.WINDOW_NO_MOVE)
@@ -777,7 +1252,9 @@ def main_loop(window, impl, receiver, visualizer):
         if expanded:
             # Left panel - main canvas
             imgui.columns(2, "main_columns")
-            imgui.set_column_width(0, 850)
+            if layout_pending:
+                imgui.set_column_width(0, 850)
+                layout_pending = False
             
             imgui.text("Live Neuromorphic Screen Capture")
             imgui.separator()
@@ -812,6 +1289,7 @@ def main_loop(window, impl, receiver, visualizer):
         
         imgui.render()
         impl.render(imgui.get_draw_data())
+        visualizer.draw_dots()
         
         glfw.swap_buffers(window)
         
@@ -829,6 +1307,8 @@ def main():
                        help='Screen height for coordinate scaling (default: 1080)')
     parser.add_argument('--gpu', action='store_true',
                        help='Enable GPU acceleration (requires CuPy)')
+    parser.add_argument('--udp-core', type=int, default=None,
+                       help='Pin the UDP receive thread to this CPU core (Linux only, default: unpinned)')
     
     args = parser.parse_args()
     
@@ -845,7 +1325,8 @@ def main():
         return 1
     
     # Create UDP receiver
-    receiver = UDPEventReceiver(args.port, buffer_size=1024 * 1024 * 20)
+    receiver = UDPEventReceiver(args.port, buffer_size=1024 * 1024 * 20, max_x=args.width, max_y=args.height,
+                                cpu_core=args.udp_core)
     if not receiver.start():
         return 1
     
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Regression tests for EventData packet ingestion
+Run with: python -m pytest test_event_data.py
+"""
+
+import numpy as np
+import pytest
+
+import neuromorphic_udp_visualizer as viz
+
+
+def make_packet_events(count, buffer_type=bytearray):
+    """Decode count events the way _process_packet does: a field view over received bytes"""
+    events = np.zeros(count, dtype=viz.EVENT_DTYPE)
+    events['timestamp'] = np.arange(count)
+    events['x'] = np.arange(count) + 10
+    events['y'] = np.arange(count) + 20
+    events['polarity'] = 1
+    return np.frombuffer(buffer_type(events.tobytes()), dtype=viz.EVENT_DTYPE)
+
+
+@pytest.mark.skipif(not viz.NUMBA_AVAILABLE, reason="numba not installed")
+@pytest.mark.parametrize("buffer_type", [bytes, bytearray])
+@pytest.mark.parametrize("count", [0, 1, 2])
+def test_add_packet_events_small_packets(count, buffer_type):
+    """0- and 1-event packets give contiguous field views, which must not hit an ambiguous overload"""
+    event_data = viz.EventData(capacity=16)
+    event_data.add_packet_events(make_packet_events(count, buffer_type), received_time=1.0)
+
+    assert event_data.write_idx == count
+    assert event_data.stats['events'] == count
+    np.testing.assert_array_equal(event_data.x[:count], np.arange(count) + 10)
+    np.testing.assert_array_equal(event_data.y[:count], np.arange(count) + 20)
+    np.testing.assert_array_equal(event_data.received_time[:count], 1.0)
@@ -4,37 +4,90 @@ Simple UDP Event Receiver for testing neuromorphic event streams
 Receives and displays neuromorphic events from the C++ UDP event streamer
 """
 
+import select
 import socket
 import struct
 import time
 import sys
 import signal
-from collections import defaultdict
+import threading
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Precompiled formats: unpack_from reads in place, so no per-field format parsing or slice copies
+PACKET_HEADER = struct.Struct('<Q')
+EVENT_FIELDS = struct.Struct('<QIIB')  # timestamp + x + y + polarity at the start of each event
+SOCKET_RECEIVE_BUFFER = 10 * 1024 * 1024  # Kernel queue that absorbs bursts while we print
+EVENT_SIZE = 32  # DVSEvent: timestamp(8) + x(4) + y(4) + polarity(1) + on(1) + padding(14)
+MAX_EVENT_X = 1920
+MAX_EVENT_Y = 1080
+REPORT_INTERVAL = 1.0  # Seconds between progress lines from the reporter thread
+MAX_DRAIN_PACKETS = 1024  # Per-wakeup receive budget, so the loop still checks self.running under flood
+MAX_DRAIN_BYTES = 1024 * 1024
+# Field view over the 32-byte event stride for the vectorized (no-Numba) path
+EVENT_DTYPE = np.dtype({'names': ['timestamp', 'x', 'y', 'polarity'],
+                        'formats': ['<u8', '<u4', '<u4', 'u1'],
+                        'offsets': [0, 8, 12, 16], 'itemsize': EVENT_SIZE})
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _count_valid_events(payload, polarity_histogram):
+        """Bounds-check every event in a packet payload and histogram the valid polarities"""
+        valid = 0
+        for i in range(payload.shape[0] // EVENT_SIZE):
+            base = i * EVENT_SIZE
+            # Little-endian uint32 x at +8 and y at +12, uint8 polarity at +16
+            x = (payload[base + 8] | (payload[base + 9] << 8) |
+                 (payload[base + 10] << 16) | (payload[base + 11] << 24))
+            y = (payload[base + 12] | (payload[base + 13] << 8) |
+                 (payload[base + 14] << 16) | (payload[base + 15] << 24))
+            if x <= MAX_EVENT_X and y <= MAX_EVENT_Y:
+                polarity_histogram[payload[base + 16]] += 1
+                valid += 1
+        return valid
 
 class EventReceiver:
-    def __init__(self, port=9999, buffer_size=131072):  # Increased buffer size
+    def __init__(self, port=9999, buffer_size=131072, verbose=False):  # Increased buffer size
         self.port = port
         self.buffer_size = buffer_size
+        self.verbose = verbose
         self.socket = None
         self.running = False
+        # stop() writes to this pair to wake the select() in run(), so shutdown needs no polling timeout
+        self.wakeup_recv = None
+        self.wakeup_send = None
+        # Reused for every datagram so the receive loop does not allocate a bytes object per packet
+        self.recv_buffer = bytearray(buffer_size)
+        self.recv_view = memoryview(self.recv_buffer)
         self.stats = {
             'packets_received': 0,
             'events_received': 0,
             'bytes_received': 0,
             'start_time': 0,
-            'polarity_counts': defaultdict(int)
+            'polarity_counts': np.zeros(256, dtype=np.int64)  # Histogram indexed by the uint8 polarity
         }
         
     def start(self):
         """Start the UDP receiver"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RECEIVE_BUFFER)
             self.socket.bind(('127.0.0.1', self.port))
-            self.socket.settimeout(1.0)  # 1 second timeout for graceful shutdown
+            self.socket.setblocking(False)  # run() waits in select() until data or a stop() wakeup arrives
+            self.wakeup_recv, self.wakeup_send = socket.socketpair()  # Sockets, so select() works on Windows too
+            if NUMBA_AVAILABLE:
+                # Compile (or load from cache) before the first packet arrives
+                _count_valid_events(np.zeros(EVENT_SIZE, dtype=np.uint8), np.zeros(256, dtype=np.int64))
             self.running = True
             self.stats['start_time'] = time.time()
             
             print(f"UDP Event Receiver started on port {self.port}")
+            print(f"Socket receive buffer: {self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)} bytes")
             print("Waiting for events from C++ streamer...")
             print("Use Ctrl+C to stop\n")
             
@@ -46,8 +99,17 @@ class EventReceiver:
     def stop(self):
         """Stop the UDP receiver"""
         self.running = False
-        if self.socket:
-            self.socket.close()
+        if self.wakeup_send:
+            try:
+                self.wakeup_send.send(b'\0')
+            except OSError:
+                pass  # Already closed
+    
+    def close(self):
+        """Release the sockets once the receive loop has exited"""
+        for sock in (self.socket, self.wakeup_recv, self.wakeup_send):
+            if sock:
+                sock.close()
     
     def process_packet(self, data):
         """Process a received UDP packet"""
@@ -57,72 +119,86 @@ class EventReceiver:
         
         try:
             # Read packet timestamp (first 8 bytes)
-            packet_timestamp = struct.unpack('<Q', data[:8])[0]
+            packet_timestamp = PACKET_HEADER.unpack_from(data, 0)[0]
             
-            # Process events in the packet
-            event_data = data[8:]
-            events_processed = 0
+            # Print first few events for debugging
+            if self.verbose and self.stats['events_received'] < 5:
+                self.print_first_events(data)
             
-            # Each DVSEvent is 32 bytes: timestamp(8) + x(4) + y(4) + polarity(1) + on(1) + padding(14)
-            event_size = 32
-            offset = 0
-            
-            while offset + event_size <= len(event_data):
-                event_bytes = event_data[offset:offset + event_size]
-                
-                if len(event_bytes) >= 17:  # Minimum needed: timestamp + x + y + polarity
-                    timestamp = struct.unpack('<Q', event_bytes[0:8])[0]
-                    x = struct.unpack('<I', event_bytes[8:12])[0]
-                    y = struct.unpack('<I', event_bytes[12:16])[0]
-                    polarity = struct.unpack('<B', event_bytes[16:17])[0]
-                    
-                    # Validate coordinates
-                    if 0 <= x <= 1920 and 0 <= y <= 1080:
-                        # Update statistics
-                        self.stats['polarity_counts'][polarity] += 1
-                        events_processed += 1
-                        
-                        # Print first few events for debugging
-                        if self.stats['events_received'] < 5:
-                            print(f"Event {self.stats['events_received']}: t={timestamp}, x={x}, y={y}, pol={polarity}")
-                
-                offset += event_size
+            if NUMBA_AVAILABLE:
+                payload = np.frombuffer(data, dtype=np.uint8, offset=PACKET_HEADER.size)
+                events_processed = _count_valid_events(payload, self.stats['polarity_counts'])
+            else:
+                events = np.frombuffer(data, dtype=EVENT_DTYPE, offset=PACKET_HEADER.size,
+                                       count=(len(data) - PACKET_HEADER.size) // EVENT_SIZE)
+                # Validate coordinates (x and y are unsigned, so only the upper bound can fail)
+                polarities = events['polarity'][(events['x'] <= MAX_EVENT_X) & (events['y'] <= MAX_EVENT_Y)]
+                self.stats['polarity_counts'] += np.bincount(polarities, minlength=256)
+                events_processed = len(polarities)
             
             self.stats['events_received'] += events_processed
-            
-            # Print periodic updates
-            if self.stats['packets_received'] % 50 == 0:
-                elapsed = time.time() - self.stats['start_time']
-                packets_per_sec = self.stats['packets_received'] / elapsed if elapsed > 0 else 0
-                events_per_sec = self.stats['events_received'] / elapsed if elapsed > 0 else 0
-                
-                print(f"Packets: {self.stats['packets_received']}, "
-                      f"Events: {self.stats['events_received']}, "
-                      f"Rate: {packets_per_sec:.1f} pkt/s, {events_per_sec:.0f} evt/s")
         
         except struct.error as e:
             print(f"Struct unpacking error: {e}")
         except Exception as e:
             print(f"Error processing packet: {e}")
     
+    def print_first_events(self, data):
+        """Print the valid events that bring the debug output up to the first five"""
+        printed = self.stats['events_received']
+        offset = PACKET_HEADER.size
+        while printed < 5 and offset + EVENT_SIZE <= len(data):
+            timestamp, x, y, polarity = EVENT_FIELDS.unpack_from(data, offset)
+            if x <= MAX_EVENT_X and y <= MAX_EVENT_Y:
+                print(f"Event {printed}: t={timestamp}, x={x}, y={y}, pol={polarity}")
+                printed += 1
+            offset += EVENT_SIZE
+    
+    def report_progress(self):
+        """Print periodic updates from a side thread so console I/O never stalls the receive loop"""
+        while self.running:
+            time.sleep(REPORT_INTERVAL)
+            elapsed = time.time() - self.stats['start_time']
+            packets_per_sec = self.stats['packets_received'] / elapsed if elapsed > 0 else 0
+            events_per_sec = self.stats['events_received'] / elapsed if elapsed > 0 else 0
+            
+            print(f"Packets: {self.stats['packets_received']}, "
+                  f"Events: {self.stats['events_received']}, "
+                  f"Rate: {packets_per_sec:.1f} pkt/s, {events_per_sec:.0f} evt/s")
+    
+    def drain_socket(self):
+        """Receive and process queued datagrams until the socket is empty or the budget is spent"""
+        drained_bytes = 0
+        for _ in range(MAX_DRAIN_PACKETS):
+            try:
+                nbytes = self.socket.recv_into(self.recv_buffer)
+            except BlockingIOError:
+                break
+            self.stats['packets_received'] += 1
+            self.stats['bytes_received'] += nbytes
+            
+            # Process the packet
+            self.process_packet(self.recv_view[:nbytes])
+            
+            drained_bytes += nbytes
+            if drained_bytes >= MAX_DRAIN_BYTES:
+                break
+    
     def run(self):
         """Main receiver loop"""
         if not self.start():
             return False
         
+        threading.Thread(target=self.report_progress, daemon=True).start()
+        
         try:
             while self.running:
                 try:
-                    data, addr = self.socket.recvfrom(self.buffer_size)
-                    self.stats['packets_received'] += 1
-                    self.stats['bytes_received'] += len(data)
-                    
-                    # Process the packet
-                    self.process_packet(data)
+                    readable = select.select([self.socket, self.wakeup_recv], [], [])[0]
+                    if self.wakeup_recv in readable:
+                        break
+                    self.drain_socket()
                     
-                except socket.timeout:
-                    # Timeout is normal, continue
-                    continue
                 except Exception as e:
                     if self.running:
                         print(f"Error receiving data: {e}")
@@ -133,6 +209,7 @@ class EventReceiver:
         
         finally:
             self.stop()
+            self.close()
             self.print_final_stats()
         
         return True
@@ -153,7 +230,9 @@ class EventReceiver:
             print(f"Average throughput: {self.stats['bytes_received'] / elapsed / 1024:.1f} KB/sec")
         
         print(f"\nPolarity distribution:")
-        for polarity, count in sorted(self.stats['polarity_counts'].items()):
+        polarity_counts = self.stats['polarity_counts']
+        for polarity in np.flatnonzero(polarity_counts):
+            count = polarity_counts[polarity]
             percentage = (count / self.stats['events_received'] * 100) if self.stats['events_received'] > 0 else 0
             print(f"  Polarity {polarity}: {count} events ({percentage:.1f}%)")
 
@@ -166,6 +245,8 @@ def main():
                        help='UDP port to listen on (default: 9999)')
     parser.add_argument('--buffer', type=int, default=131072,
                        help='UDP receive buffer size (default: 131072)')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Print the first few received events')
     
     args = parser.parse_args()
     
@@ -175,7 +256,7 @@ def main():
     print(f"Buffer size: {args.buffer} bytes")
     print()
     
-    receiver = EventReceiver(args.port, args.buffer)
+    receiver = EventReceiver(args.port, args.buffer, args.verbose)
     
     # Set up signal handler for graceful shutdown
     def signal_handler(sig, frame):
@@ -9,55 +9,57 @@ import struct
 import time
 import sys
 
+# Precompiled formats: unpack_from reads in place, so no per-field format parsing or slice copies
+PACKET_HEADER = struct.Struct('<Q')
+DVS_EVENT = struct.Struct('<QHHb')  # DVSEvent: timestamp(8) + x(2) + y(2) + polarity(1)
+SOCKET_RECEIVE_BUFFER = 10 * 1024 * 1024  # Kernel queue that absorbs bursts while we print
+
 def test_udp_reception():
     print("Simple UDP Event Reception Test")
     print("===============================")
     
     # Create UDP socket
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RECEIVE_BUFFER)
     sock.bind(('127.0.0.1', 9999))
     sock.settimeout(5.0)  # 5 second timeout
     
     print("Listening on 127.0.0.1:9999...")
+    print(f"Socket receive buffer: {sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)} bytes")
     print("Start C++ UDP streamer now...")
     
     packets_received = 0
     events_received = 0
+    recv_buffer = bytearray(65536)
+    recv_view = memoryview(recv_buffer)
     
     try:
         while packets_received < 10:  # Test first 10 packets
             try:
-                data, addr = sock.recvfrom(65536)
+                nbytes, addr = sock.recvfrom_into(recv_buffer)
+                data = recv_view[:nbytes]
                 packets_received += 1
                 
                 print(f"\nPacket {packets_received}: {len(data)} bytes from {addr}")
                 
                 if len(data) >= 8:
                     # Extract packet timestamp
-                    packet_timestamp = struct.unpack('<Q', data[:8])[0]
+                    packet_timestamp = PACKET_HEADER.unpack_from(data, 0)[0]
                     print(f"  Packet timestamp: {packet_timestamp}")
                     
                     # Extract events
-                    event_data = data[8:]
-                    event_size = 13  # DVSEvent: timestamp(8) + x(2) + y(2) + polarity(1)
-                    num_events = len(event_data) // event_size
+                    event_data_size = len(data) - PACKET_HEADER.size
+                    event_size = DVS_EVENT.size
+                    num_events = event_data_size // event_size
                     
-                    print(f"  Event data: {len(event_data)} bytes, {num_events} events")
+                    print(f"  Event data: {event_data_size} bytes, {num_events} events")
                     
-                    # Parse first few events
+                    # Parse first few events in one pass over a zero-copy slice of the payload
                     events_parsed = 0
-                    for i in range(min(3, num_events)):
-                        offset = i * event_size
-                        if offset + event_size <= len(event_data):
-                            event_bytes = event_data[offset:offset + event_size]
-                            if len(event_bytes) >= 13:
-                                timestamp = struct.unpack('<Q', event_bytes[0:8])[0]
-                                x = struct.unpack('<H', event_bytes[8:10])[0]
-                                y = struct.unpack('<H', event_bytes[10:12])[0]
-                                polarity = struct.unpack('<b', event_bytes[12:13])[0]
-                                
-                                print(f"    Event {i}: t={timestamp}, x={x}, y={y}, pol={polarity}")
-                                events_parsed += 1
+                    first_events = data[PACKET_HEADER.size:PACKET_HEADER.size + min(3, num_events) * event_size]
+                    for i, (timestamp, x, y, polarity) in enumerate(DVS_EVENT.iter_unpack(first_events)):
+                        print(f"    Event {i}: t={timestamp}, x={x}, y={y}, pol={polarity}")
+                        events_parsed += 1
                     
                     events_received += num_events
                     